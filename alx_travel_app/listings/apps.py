@@ -8,3 +8,7 @@ class ListingsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "listings"
+
+    def ready(self):
+        """Connect the signal receivers defined in listings.signals."""
+        from . import signals  # noqa: F401
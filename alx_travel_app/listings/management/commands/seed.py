@@ -9,21 +9,86 @@ with varied ratings.
 
 import datetime
 import random
+from decimal import Decimal
+from uuid import uuid4
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Case, DateTimeField, Value, When
 from django.utils import timezone
 
 try:
     from faker import Faker
-
-    fake = Faker()
 except ImportError as exc:
     raise ImportError(
         "The Faker package is required. Install it with 'pipenv install faker'"
     ) from exc
 
-from listings.models import Booking, Listing, Review, User
+from listings.models import Booking, Listing, Payment, Review, User
+from listings.signals import update_average_rating
+
+# Number of rows created for each model
+NUM_USERS = 19
+NUM_LISTINGS = 12
+NUM_BOOKINGS = 30
+NUM_REVIEWS = 51
+
+# Rows are built in memory and written with one multi-row INSERT per batch
+BATCH_SIZE = 500
+
+# Review columns written directly by _create_reviews, in insert order
+REVIEW_INSERT_FIELDS = (
+    "review_id",
+    "listing",
+    "reviewed_by",
+    "rating",
+    "comment",
+    "created_at",
+    "updated_at",
+)
+
+# Prices are drawn as whole cents and scaled to avoid float rounding
+CENTS = Decimal(100)
+
+# Faker is slow per call, so hot fields are sampled from pre-generated pools
+FAKE_POOL_SIZE = 500
+
+# Paragraphs are the most expensive Faker output, so a smaller pool is reused
+PARAGRAPH_POOL_SIZE = 50
+
+# Faker instances are expensive to build, so create them lazily per locale
+_faker_cache = {}
+
+
+def get_faker(locale="en_US"):
+    """Return the cached Faker instance for ``locale``, creating it on first use."""
+    fake = _faker_cache.get(locale)
+    if fake is None:
+        fake = _faker_cache[locale] = Faker(locale)
+    return fake
+
+
+def stagger_timestamps(model, objs, now):
+    """
+    Backdate ``objs`` one second apart from ``now``, newest first.
+    bulk_create stamps auto_now/auto_now_add fields itself, so the spread
+    is written afterwards with one UPDATE per batch instead of per row.
+    """
+    for start in range(0, len(objs), BATCH_SIZE):
+        batch = objs[start : start + BATCH_SIZE]
+        stamps = {
+            obj.pk: now - datetime.timedelta(seconds=start + i)
+            for i, obj in enumerate(batch)
+        }
+        stamp = Case(
+            *(When(pk=pk, then=Value(ts)) for pk, ts in stamps.items()),
+            output_field=DateTimeField(),
+        )
+        model._base_manager.filter(pk__in=stamps).update(
+            created_at=stamp, updated_at=stamp
+        )
+        for obj in batch:
+            obj.created_at = obj.updated_at = stamps[obj.pk]
 
 
 class Command(BaseCommand):
@@ -31,7 +96,14 @@ class Command(BaseCommand):
 
     help = "Seeds the database with sample data"
 
-    @transaction.atomic
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Generate the data on Celery workers instead of in this process",
+        )
+
     def handle(self, *args, **kwargs):
         """
         Handle the command to seed the database.
@@ -39,28 +111,35 @@ class Command(BaseCommand):
         """
         self.stdout.write("Seeding database...")
 
+        if kwargs["parallel"]:
+            self._seed_with_celery()
+        else:
+            self._seed()
+
+    @transaction.atomic
+    def _seed(self):
+        """Seed the database in this process within a single transaction."""
+        self._build_fake_pools(get_faker())
+
         # Delete all existing data to avoid duplicates
         self.stdout.write("Deleting existing data...")
-        Booking.objects.all().delete()
-        Review.objects.all().delete()
-        Listing.objects.all().delete()
-        User.objects.all().delete()
+        self._delete_existing_data()
 
         # Create sample users
         self.stdout.write("Creating sample users...")
-        users = self._create_users(19)  # Create 19 users
+        users = self._create_users(NUM_USERS)
 
         # Create sample listings
         self.stdout.write("Creating sample listings...")
-        listings = self._create_listings(users, 12)  # Create 12 listings
+        listings = self._create_listings(users, NUM_LISTINGS)
 
         # Create sample bookings
         self.stdout.write("Creating sample bookings...")
-        bookings = self._create_bookings(users, listings, 30)  # Create 30 bookings
+        bookings = self._create_bookings(users, listings, NUM_BOOKINGS)
 
         # Create sample reviews
         self.stdout.write("Creating sample reviews...")
-        self._create_reviews(users, listings, 51)  # Create 51 reviews
+        reviews = self._create_reviews(users, listings, NUM_REVIEWS)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -68,31 +147,113 @@ class Command(BaseCommand):
                 f"- {len(users)} users\n"
                 f"- {len(listings)} listings\n"
                 f"- {len(bookings)} bookings\n"
-                f"- {Review.objects.count()} reviews"
+                f"- {len(reviews)} reviews"
+            )
+        )
+
+    def _seed_with_celery(self):
+        """
+        Seed the database on Celery workers.
+        Users and listings are created first, then bookings and reviews are
+        generated concurrently, each task in its own transaction.
+        """
+        # Imported here so the in-process path never loads Celery
+        from celery import chain, group
+
+        from listings.tasks import (
+            seed_bookings,
+            seed_listings,
+            seed_reviews,
+            seed_users,
+        )
+
+        # Workers only see committed rows, so clear the tables up front
+        self.stdout.write("Deleting existing data...")
+        with transaction.atomic():
+            self._delete_existing_data()
+
+        self.stdout.write("Dispatching seed tasks to Celery workers...")
+        workflow = chain(
+            seed_users.s(NUM_USERS),
+            seed_listings.s(NUM_LISTINGS),
+            group(seed_bookings.s(NUM_BOOKINGS), seed_reviews.s(NUM_REVIEWS)),
+        )
+        bookings_count, reviews_count = workflow.apply_async().get()
+
+        # The helpers may create more rows than requested (one listing per
+        # property type at least), so report what the tables now hold
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully seeded database with:\n"
+                f"- {User.objects.count()} users\n"
+                f"- {Listing.listings.count()} listings\n"
+                f"- {bookings_count} bookings\n"
+                f"- {reviews_count} reviews"
             )
         )
 
+    def _build_fake_pools(self, fake):
+        """Pre-generate the Faker values sampled by the creation helpers."""
+        self.fake = fake
+        self.first_names = tuple(fake.first_name() for _ in range(FAKE_POOL_SIZE))
+        self.last_names = tuple(fake.last_name() for _ in range(FAKE_POOL_SIZE))
+        self.user_names = tuple(fake.user_name() for _ in range(FAKE_POOL_SIZE))
+        self.addresses = tuple(fake.address() for _ in range(FAKE_POOL_SIZE))
+        self.catch_phrases = tuple(fake.catch_phrase() for _ in range(FAKE_POOL_SIZE))
+        self.paragraphs_3 = tuple(
+            fake.paragraph(nb_sentences=3) for _ in range(PARAGRAPH_POOL_SIZE)
+        )
+        self.paragraphs_5 = tuple(
+            fake.paragraph(nb_sentences=5) for _ in range(PARAGRAPH_POOL_SIZE)
+        )
+
+    def _delete_existing_data(self):
+        """Delete existing data without going through the ORM delete collector."""
+        if connection.vendor == "postgresql":
+            tables = ", ".join(
+                connection.ops.quote_name(model._meta.db_table)
+                for model in (Payment, Booking, Review, Listing, User)
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE")
+            return
+
+        # Dependants are cleared first, so these raw deletes need no cascade
+        for queryset in (
+            Payment.payments.all(),
+            Booking.bookings.all(),
+            Review.reviews.all(),
+            Listing.listings.all(),
+        ):
+            queryset._raw_delete(queryset.db)
+
+        # Users are also referenced by auth and admin tables, so let the ORM cascade
+        User.objects.all().delete()
+
     def _create_users(self, count):
         """Create sample users."""
         users = []
-        for _ in range(count):
-            dob = fake.date_of_birth(minimum_age=18, maximum_age=80)
-            dob_datetime = datetime.datetime.combine(
-                dob, datetime.time.min, tzinfo=timezone.get_current_timezone()
-            )
-
-            user = User.objects.create(
-                email=fake.email(),
-                first_name=fake.first_name(),
-                last_name=fake.last_name(),
-                date_of_birth=dob_datetime,
+        now = timezone.now()
+        for i in range(count):
+            # The row index keeps emails unique without checking the database
+            email = f"seed{i}_{random.choice(self.user_names)}@example.com"
+            user = User(
+                email=email,
+                username=email,
+                first_name=random.choice(self.first_names),
+                last_name=random.choice(self.last_names),
+                date_of_birth=self.fake.date_of_birth(minimum_age=18, maximum_age=80),
+                date_joined=now - datetime.timedelta(seconds=i),
             )
             users.append(user)
+
+        User.objects.bulk_create(users, batch_size=BATCH_SIZE)
         return users
 
     def _create_listings(self, users, count):
         """Create sample listings of various property types."""
         listings = []
+        now = timezone.now()
         property_types = [
             "HOUSE",
             "VILLA",
@@ -144,119 +305,83 @@ class Command(BaseCommand):
             "Carbon monoxide alarm",
         ]
 
-        # Ensure we create at least one listing of each property type
-        for property_type in property_types:
-            host = random.choice(users)
-            amenities = random.sample(amenities_options, k=random.randint(3, 10))
-
-            # Set available date to a random date in the future (up to 1 year)
-            available_from = timezone.now() + datetime.timedelta(
-                days=random.randint(1, 30)
-            )
-
-            listing = Listing.objects.create(
-                title=f"{fake.catch_phrase()} {property_type.capitalize()}",
-                description=fake.paragraph(nb_sentences=5),
-                listing_type=property_type,
-                price_per_night=round(random.uniform(50, 1000), 2),
-                location_address=fake.address(),
-                allowable_guests=random.randint(1, 12),
-                number_of_bedrooms=random.randint(1, 6),
-                number_of_bathrooms=random.randint(1, 6),
-                amenities=amenities,
-                host=host,
-                available_from=available_from,
-            )
-            listings.append(listing)
+        # Draw every random column up front instead of one value per row
+        total = max(count, len(property_types))
+        hosts = random.choices(users, k=total)
+        amenity_counts = random.choices(range(3, 11), k=total)
+        available_days = random.choices(range(1, 31), k=total)
+        prices = random.choices(range(5000, 100001), k=total)
+        guests = random.choices(range(1, 13), k=total)
+        bedrooms = random.choices(range(1, 7), k=total)
+        bathrooms = random.choices(range(1, 7), k=total)
+
+        # Ensure we create at least one listing of each property type,
+        # then pick random types for the remaining listings
+        listing_types = property_types + random.choices(
+            property_types, k=total - len(property_types)
+        )
 
-        # Create remaining random listings to reach the desired count
-        for _ in range(count - len(property_types)):
-            host = random.choice(users)
-            property_type = random.choice(property_types)
-            amenities = random.sample(amenities_options, k=random.randint(3, 10))
+        for i, property_type in enumerate(listing_types):
+            amenities = random.sample(amenities_options, k=amenity_counts[i])
 
             # Set available date to a random date in the future (up to 1 year)
-            available_from = timezone.now() + datetime.timedelta(
-                days=random.randint(1, 30)
-            )
+            available_from = now + datetime.timedelta(days=available_days[i])
 
-            listing = Listing.objects.create(
-                title=f"{fake.catch_phrase()} {property_type.capitalize()}",
-                description=fake.paragraph(nb_sentences=5),
+            listing = Listing(
+                title=f"{random.choice(self.catch_phrases)} {property_type.capitalize()}",
+                description=random.choice(self.paragraphs_5),
                 listing_type=property_type,
-                price_per_night=round(random.uniform(50, 1000), 2),
-                location_address=fake.address(),
-                allowable_guests=random.randint(1, 12),
-                number_of_bedrooms=random.randint(1, 6),
-                number_of_bathrooms=random.randint(1, 6),
+                price_per_night=Decimal(prices[i]) / CENTS,
+                location_address=random.choice(self.addresses),
+                allowable_guests=guests[i],
+                number_of_bedrooms=bedrooms[i],
+                number_of_bathrooms=bathrooms[i],
                 amenities=amenities,
-                host=host,
+                host=hosts[i],
                 available_from=available_from,
             )
             listings.append(listing)
 
+        Listing.listings.bulk_create(listings, batch_size=BATCH_SIZE)
+        stagger_timestamps(Listing, listings, now)
         return listings
 
     def _create_bookings(self, users, listings, count):
         """Create sample bookings with different confirmation statuses."""
         bookings = []
+        now = timezone.now()
         statuses = ["PENDING", "CONFIRMED", "CANCELLED"]
+        host_index = self._host_index(users, listings)
 
-        # Ensure at least one booking of each status type
-        for status in statuses:
-            user = random.choice(users)
-            listing = random.choice(listings)
+        # Draw every random column up front instead of one value per row
+        total = max(count, len(statuses))
+        booked_listings = random.choices(listings, k=total)
+        check_in_offsets = random.choices(range(1, 91), k=total)
+        stay_lengths = random.choices(range(1, 15), k=total)
 
-            # Ensure the user is not the host
-            while user == listing.host:
-                user = random.choice(users)
+        # Ensure at least one booking of each status type,
+        # then pick random statuses for the remaining bookings
+        booking_statuses = statuses + random.choices(statuses, k=total - len(statuses))
 
-            # Set dates in the future, starting from the listing's available date
-            check_in = listing.available_from + datetime.timedelta(
-                days=random.randint(1, 90)
-            )
-            check_out = check_in + datetime.timedelta(days=random.randint(1, 14))
-
-            guests = random.randint(1, min(listing.allowable_guests, 10))
-
-            # Calculate amount due based on dates and price
-            duration = (check_out - check_in).days
-            amount_due = float(listing.price_per_night) * duration
-
-            booking = Booking.objects.create(
-                listing=listing,
-                booked_by=user,
-                number_of_guests=guests,
-                booking_status=status,
-                check_in_date=check_in,
-                check_out_date=check_out,
-                amount_due=amount_due,
-            )
-            bookings.append(booking)
-
-        # Create remaining random bookings
-        for _ in range(count - len(statuses)):
-            user = random.choice(users)
-            listing = random.choice(listings)
+        for i, status in enumerate(booking_statuses):
+            listing = booked_listings[i]
 
             # Ensure the user is not the host
-            while user == listing.host:
-                user = random.choice(users)
+            user = self._pick_non_host(users, host_index[id(listing)])
 
             # Set dates in the future, starting from the listing's available date
             check_in = listing.available_from + datetime.timedelta(
-                days=random.randint(1, 90)
+                days=check_in_offsets[i]
             )
-            check_out = check_in + datetime.timedelta(days=random.randint(1, 14))
+            check_out = check_in + datetime.timedelta(days=stay_lengths[i])
 
             guests = random.randint(1, min(listing.allowable_guests, 10))
-            status = random.choice(statuses)
 
             # Calculate amount due based on dates and price
             duration = (check_out - check_in).days
-            amount_due = float(listing.price_per_night) * duration
+            amount_due = listing.price_per_night * duration
 
-            booking = Booking.objects.create(
+            booking = Booking(
                 listing=listing,
                 booked_by=user,
                 number_of_guests=guests,
@@ -267,46 +392,78 @@ class Command(BaseCommand):
             )
             bookings.append(booking)
 
+        Booking.bookings.bulk_create(bookings, batch_size=BATCH_SIZE)
+        stagger_timestamps(Booking, bookings, now)
         return bookings
 
     def _create_reviews(self, users, listings, count):
-        """Create sample reviews with varied ratings."""
-        reviews = []
+        """
+        Create sample reviews with varied ratings.
+        Reviews are the largest table, so rows are inserted as plain tuples
+        with executemany instead of building Review instances.
+        Listing average ratings are refreshed once all rows are in.
+        Returns the IDs of the created reviews.
+        """
+        rows = []
+        now = timezone.now()
+        host_index = self._host_index(users, listings)
+        fields = [Review._meta.get_field(name) for name in REVIEW_INSERT_FIELDS]
 
-        # Create at least one review with each rating (1-5)
-        for rating in range(1, 6):
-            user = random.choice(users)
-            listing = random.choice(listings)
+        # Draw every random column up front instead of one value per row
+        total = max(count, 5)
+        reviewed_listings = random.choices(listings, k=total)
 
-            # Ensure the user is not the host
-            while user == listing.host:
-                user = random.choice(users)
+        # Create at least one review with each rating (1-5),
+        # then pick random ratings for the remaining reviews
+        ratings = list(range(1, 6)) + random.choices(range(1, 6), k=total - 5)
 
-            review = Review.objects.create(
-                listing=listing,
-                reviewed_by=user,
-                rating=rating,
-                comment=fake.paragraph(nb_sentences=3),
+        for i, rating in enumerate(ratings):
+            listing = reviewed_listings[i]
+
+            # Ensure the user is not the host
+            user = self._pick_non_host(users, host_index[id(listing)])
+
+            # One second apart, newest first, so the rows don't all tie
+            created_at = now - datetime.timedelta(seconds=i)
+            values = (
+                uuid4(),
+                listing.pk,
+                user.pk,
+                rating,
+                random.choice(self.paragraphs_3),
+                created_at,
+                created_at,
+            )
+            rows.append(
+                tuple(
+                    field.get_db_prep_value(value, connection)
+                    for field, value in zip(fields, values)
+                )
             )
-            reviews.append(review)
 
-        # Create remaining random reviews
-        for _ in range(count - 5):
-            user = random.choice(users)
-            listing = random.choice(listings)
+        quote_name = connection.ops.quote_name
+        table = quote_name(Review._meta.db_table)
+        columns = ", ".join(quote_name(field.column) for field in fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows
+            )
 
-            # Ensure the user is not the host
-            while user == listing.host:
-                user = random.choice(users)
+        # The raw insert skips the Review signals, so refresh the ratings here
+        update_average_rating(
+            Listing.listings.filter(pk__in=[listing.pk for listing in listings])
+        )
 
-            rating = random.randint(1, 5)
+        return [row[0] for row in rows]
 
-            review = Review.objects.create(
-                listing=listing,
-                reviewed_by=user,
-                rating=rating,
-                comment=fake.paragraph(nb_sentences=3),
-            )
-            reviews.append(review)
+    @staticmethod
+    def _host_index(users, listings):
+        """Map each listing to the position of its host in ``users``."""
+        return {id(listing): users.index(listing.host) for listing in listings}
 
-        return reviews
+    @staticmethod
+    def _pick_non_host(users, host_idx):
+        """Pick a random user, skipping the one at ``host_idx``."""
+        j = random.randrange(len(users) - 1)
+        return users[j + (j >= host_idx)]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.1 on 2026-10-15 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("listings", "0003_alter_user_password_payment"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["listing", "check_in_date"],
+                name="travel_book_listing_bad7ed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["booked_by", "booking_status"],
+                name="travel_book_booked__f0269d_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="listing",
+            index=models.Index(
+                fields=["-created_at"], name="travel_list_created_78e1b4_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="listing",
+            index=models.Index(
+                fields=["listing_type", "price_per_night"],
+                name="travel_list_listing_15c4cc_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["listing", "-created_at"], name="listings_re_listing_515c5d_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-15 14:06
+
+import listings.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("listings", "0004_booking_travel_book_listing_bad7ed_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="date_of_birth",
+            field=models.DateField(default=listings.models.default_date_of_birth),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.1 on 2026-10-15 14:12
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Avg, DecimalField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_average_rating(apps, schema_editor):
+    """Populate average_rating for listings that already have reviews."""
+    Listing = apps.get_model("listings", "Listing")
+    Review = apps.get_model("listings", "Review")
+    ratings = (
+        Review._base_manager.filter(listing=OuterRef("pk"))
+        .order_by()
+        .values("listing")
+        .annotate(avg_rating=Avg("rating"))
+        .values("avg_rating")
+    )
+    Listing._base_manager.update(
+        average_rating=Coalesce(
+            Subquery(ratings, output_field=DecimalField()),
+            Decimal(0),
+            output_field=DecimalField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("listings", "0005_user_date_of_birth"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="listing",
+            name="average_rating",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                editable=False,
+                help_text="Average review rating, kept up to date by the Review signals.",
+                max_digits=3,
+            ),
+        ),
+        migrations.RunPython(backfill_average_rating, migrations.RunPython.noop),
+    ]
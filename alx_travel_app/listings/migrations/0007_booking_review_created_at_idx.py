@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-15 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("listings", "0006_listing_average_rating"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["-created_at"], name="travel_book_created_b663fe_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["-created_at"], name="listings_re_created_b75c3f_idx"
+            ),
+        ),
+    ]
@@ -4,10 +4,11 @@ This module defines the data structures used in the application, including
 listings, users, bookings, and reviews.
 """
 
-import os
+import datetime
 from enum import Enum
 from uuid import uuid4
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import (
     MaxValueValidator,
@@ -17,6 +18,13 @@ from django.core.validators import (
 from django.db import models
 
 
+def default_date_of_birth():
+    """
+    Returns the placeholder date of birth for users who did not provide one.
+    """
+    return datetime.date(1900, 1, 1)
+
+
 # Create your models here.
 class User(AbstractUser):
     """
@@ -27,6 +35,7 @@ class User(AbstractUser):
         primary_key=True, unique=True, null=False, editable=False, default=uuid4
     )
     email = models.EmailField(unique=True)
+    date_of_birth = models.DateField(default=default_date_of_birth)
     password = models.CharField(
         max_length=128,
         validators=[
@@ -72,7 +81,7 @@ class User(AbstractUser):
         Custom clean method to ensure password meets complexity requirements.
         """
         if not self.password:
-            self.set_password(os.getenv("DEFAULT_PASSWORD"))
+            self.set_password(settings.DEFAULT_PASSWORD)
 
     class Meta:
         """
@@ -150,6 +159,13 @@ class Listing(models.Model):
         User, on_delete=models.CASCADE, related_name="listings_host"
     )
     available_from = models.DateTimeField()
+    average_rating = models.DecimalField(
+        max_digits=3,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        help_text="Average review rating, kept up to date by the Review signals.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -163,6 +179,10 @@ class Listing(models.Model):
         verbose_name = "Travel Listing"
         verbose_name_plural = "Travel Listings"
         db_table = "travel_listings"
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["listing_type", "price_per_night"]),
+        ]
 
     def __str__(self):
         """
@@ -175,12 +195,28 @@ class Listing(models.Model):
         )
 
 
+class BookingManager(models.Manager):
+    """
+    Manager for the Booking model.
+    Joins the listing and guest so __str__ and list views avoid extra queries.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("listing", "booked_by")
+
+    def with_host(self):
+        """
+        Returns bookings with the listing's host joined as well.
+        """
+        return self.get_queryset().select_related("listing__host")
+
+
 class Booking(models.Model):
     """
     Model representing a booking for a travel listing.
     """
 
-    bookings = models.Manager()
+    bookings = BookingManager()
 
     booking_id = models.UUIDField(primary_key=True, editable=False, default=uuid4)
     listing = models.ForeignKey(
@@ -222,6 +258,11 @@ class Booking(models.Model):
         verbose_name = "Booking"
         verbose_name_plural = "Bookings"
         db_table = "travel_bookings"
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["listing", "check_in_date"]),
+            models.Index(fields=["booked_by", "booking_status"]),
+        ]
 
     def clean(self):
         """
@@ -238,7 +279,7 @@ class Booking(models.Model):
             duration = (self.check_out_date - self.check_in_date).days
 
             if duration > 0:
-                return duration * float(self.listing.price_per_night)
+                return self.listing.price_per_night * duration
             raise ValueError("End date must be after start date.")
 
         raise ValueError("Listing, start date, and end date must be set.")
@@ -247,12 +288,28 @@ class Booking(models.Model):
         return f"Booking for {self.listing.title} by {self.booked_by.name} from {self.check_in_date} to {self.check_out_date}"
 
 
+class ReviewManager(models.Manager):
+    """
+    Manager for the Review model.
+    Joins the listing and reviewer so __str__ and list views avoid extra queries.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("listing", "reviewed_by")
+
+    def with_host(self):
+        """
+        Returns reviews with the listing's host joined as well.
+        """
+        return self.get_queryset().select_related("listing__host")
+
+
 class Review(models.Model):
     """
     Model representing a review for a travel listing.
     """
 
-    reviews = models.Manager()
+    reviews = ReviewManager()
     review_id = models.UUIDField(primary_key=True, editable=False, default=uuid4)
     listing = models.ForeignKey(
         Listing, on_delete=models.CASCADE, related_name="reviews_listing"
@@ -265,6 +322,17 @@ class Review(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        """
+        Meta class for the Review model.
+        This class defines the indexes for the model.
+        """
+
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["listing", "-created_at"]),
+        ]
+
     def __str__(self):
         return f"Review for {self.listing.title} by {self.reviewed_by.name}"
 
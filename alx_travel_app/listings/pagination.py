@@ -0,0 +1,25 @@
+"""pagination.py
+# Pagination classes for the travel listings API.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class OrderedCursorPagination(CursorPagination):
+    """
+    Cursor pagination that orders by the viewset's ``ordering`` tuple.
+    Keyset pages stay cheap however deep the client goes, unlike OFFSET.
+    Orderings end in the primary key, so rows that share a timestamp
+    still come back in one fixed order and are never skipped or repeated.
+    """
+
+    ordering = ("-created_at", "-pk")
+
+    def get_ordering(self, request, queryset, view):
+        """Use the viewset's ordering, with the primary key as tiebreaker."""
+        ordering = getattr(view, "ordering", None) or self.ordering
+        ordering = (ordering,) if isinstance(ordering, str) else tuple(ordering)
+        pk_name = queryset.model._meta.pk.name
+        if not {"pk", "-pk", pk_name, f"-{pk_name}"} & set(ordering):
+            ordering += (f"-{pk_name}",)
+        return ordering
@@ -1,15 +1,10 @@
 """serializers.py"""
 
-import os
-from django.db.models import Avg
+from django.conf import settings
 from rest_framework import serializers
-from dotenv import load_dotenv
 from .models import Booking, Listing, Review, User, Payment
 
 
-load_dotenv()
-
-
 class UserSerializer(serializers.ModelSerializer):
     """
     Serializer for the User model.
@@ -34,7 +29,7 @@ class UserSerializer(serializers.ModelSerializer):
         Create a new user instance.
         """
         # Ensure password is set correctly
-        password = validated_data.pop("password", os.getenv("DEFAULT_PASSWORD"))
+        password = validated_data.pop("password", settings.DEFAULT_PASSWORD)
         user = User(**validated_data)
 
         if password:
@@ -53,7 +48,18 @@ class BookingSerializer(serializers.ModelSerializer):
         """Meta class for BookingSerializer."""
 
         model = Booking
-        fields = "__all__"
+        fields = [
+            "booking_id",
+            "listing",
+            "booked_by",
+            "number_of_guests",
+            "booking_status",
+            "check_in_date",
+            "check_out_date",
+            "amount_due",
+            "created_at",
+            "updated_at",
+        ]
         read_only_fields = ("booking_id", "amount_due")
 
     def validate(self, attrs):
@@ -93,16 +99,22 @@ class BookingSerializer(serializers.ModelSerializer):
                     f"Number of guests cannot exceed the listing's maximum capacity of {listing.allowable_guests}."
                 )
 
-        return attrs
+        # Store the amount due with the booking so reads never recompute it
+        listing = listing or getattr(self.instance, "listing", None)
+        if listing:
+            booking = Booking(
+                listing=listing,
+                check_in_date=attrs["check_in_date"],
+                check_out_date=attrs["check_out_date"],
+            )
+            try:
+                attrs["amount_due"] = booking.calculate_amount_due()
+            except ValueError as exc:
+                raise serializers.ValidationError(
+                    "A booking must cover at least one night."
+                ) from exc
 
-    def get_amount_due(self, obj):
-        """
-        Calculate the amount due for the booking based
-        on the listing's price per night
-        and the duration of the stay.
-        """
-        duration = (obj.check_out_date - obj.check_in_date).days
-        return duration * float(obj.listing.price_per_night)
+        return attrs
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -114,7 +126,15 @@ class ReviewSerializer(serializers.ModelSerializer):
         """Meta class for ReviewSerializer."""
 
         model = Review
-        fields = "__all__"
+        fields = [
+            "review_id",
+            "listing",
+            "reviewed_by",
+            "rating",
+            "comment",
+            "created_at",
+            "updated_at",
+        ]
 
     def validate(self, attrs):
         """
@@ -125,23 +145,74 @@ class ReviewSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class ListingListSerializer(serializers.ListSerializer):
+    """
+    List serializer that inserts a batch of listings in a single query.
+    """
+
+    def create(self, validated_data):
+        """
+        Create all listings with one bulk INSERT instead of one per listing.
+        """
+        return Listing.listings.bulk_create(
+            [Listing(**attrs) for attrs in validated_data]
+        )
+
+
 class ListingSerializer(serializers.ModelSerializer):
     """
     Serializer for the Listing model.
     """
 
+    # Stored as a Decimal and rendered as a float, like ListingRowSerializer
+    average_rating = serializers.FloatField(read_only=True)
+
     class Meta:
         """Meta class for ListingSerializer."""
 
         model = Listing
-        fields = "__all__"
+        fields = [
+            "listing_id",
+            "title",
+            "description",
+            "host",
+            "listing_type",
+            "price_per_night",
+            "location_address",
+            "allowable_guests",
+            "number_of_bedrooms",
+            "number_of_bathrooms",
+            "amenities",
+            "available_from",
+            "average_rating",
+            "created_at",
+            "updated_at",
+        ]
+        list_serializer_class = ListingListSerializer
+
+
+class ListingRowSerializer(serializers.Serializer):
+    """
+    Read-only serializer for listing rows fetched with values().
+    Renders the same output as ListingSerializer without building
+    Listing instances, for the listing list endpoint.
+    """
 
-    def get_average_rating(self, obj):
-        """
-        Calculate the average rating for the listing.
-        """
-        avg = obj.reviews.aggregate(avg_rating=Avg("rating"))["avg_rating"]
-        return float(avg) if avg else 0.0
+    listing_id = serializers.UUIDField()
+    title = serializers.CharField()
+    description = serializers.CharField()
+    host = serializers.UUIDField()
+    listing_type = serializers.CharField()
+    price_per_night = serializers.DecimalField(max_digits=10, decimal_places=2)
+    location_address = serializers.CharField()
+    allowable_guests = serializers.IntegerField()
+    number_of_bedrooms = serializers.IntegerField()
+    number_of_bathrooms = serializers.IntegerField()
+    amenities = serializers.JSONField()
+    available_from = serializers.DateTimeField()
+    average_rating = serializers.FloatField()
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
 
 
 class PaymentSerializer(serializers.ModelSerializer):
@@ -153,7 +224,15 @@ class PaymentSerializer(serializers.ModelSerializer):
         """Meta class for PaymentSerializer."""
 
         model = Payment
-        fields = "__all__"
+        fields = [
+            "transaction_id",
+            "booking",
+            "payer",
+            "payee",
+            "amount",
+            "status",
+            "transaction_date",
+        ]
 
     def validate(self, attrs):
         """
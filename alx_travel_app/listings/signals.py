@@ -4,27 +4,43 @@
 # such as creating or updating listings, users, bookings, and reviews.
 """
 
-from django.db.models.signals import post_save
+from decimal import Decimal
+
+from django.db.models import Avg, DecimalField, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Now
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from .models import User
+from .models import Listing, Review
+
 
-from rest_framework_simplejwt.tokens import Token
+def update_average_rating(listings):
+    """
+    Recompute the stored average_rating of the given listings queryset
+    in a single UPDATE, using a correlated subquery over their reviews.
+    updated_at is bumped as well so cached listing responses are invalidated.
+    """
+    ratings = (
+        Review.reviews.filter(listing=OuterRef("pk"))
+        .order_by()
+        .values("listing")
+        .annotate(avg_rating=Avg("rating"))
+        .values("avg_rating")
+    )
+    listings.update(
+        average_rating=Coalesce(
+            Subquery(ratings, output_field=DecimalField()),
+            Decimal(0),
+            output_field=DecimalField(),
+        ),
+        updated_at=Now(),
+    )
 
 
-@receiver(post_save, sender=User)
-def create_user_jwt_tokens(sender, instance, created, **kwargs):
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def update_listing_average_rating(sender, instance, **kwargs):
     """
-    Signal to create a user profile when a User instance is created.
-    This can be extended to create related models or perform additional actions.
+    Signal to refresh the cached average rating of a listing
+    whenever one of its reviews is saved or deleted.
     """
-    if created:
-        # Here you can create a profile or perform other actions
-        print(f"User profile created for {instance.email}")
-        token = Token.for_user(instance)
-        print(f"JWT Token created for {instance.email}: {token}")
-        # You can also save the token to the user model or perform other actions
-        # instance.profile.save()  # If you have a profile model related to User
-        # instance.jwt_token = token  # If you want to save the token in the user model
-        # instance.save()  # Save the user instance if you modified it
-        # Note: Ensure you have the necessary imports and configurations for JWT tokens
-        # This is just an example; you can customize it as needed
+    update_average_rating(Listing.listings.filter(pk=instance.listing_id))
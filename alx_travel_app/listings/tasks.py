@@ -1,19 +1,65 @@
 """tasks.py
 Celery tasks for the ALX Travel App.
-This module contains tasks related to booking confirmations.
+This module contains tasks related to booking confirmations and
+parallel database seeding.
 """
 
+from functools import cache
+
 from celery import shared_task
-from .models import Booking
+from django.core import mail
+from django.db import transaction
+
+from .models import Booking, Listing, User
 
 
 @shared_task
-def send_booking_confirmation_email(booking: Booking):
+def send_booking_confirmation_email(booking_id):
     """
     Sends a booking confirmation email to the user.
+    The booking, its guest, listing and host are loaded in one query.
 
     Args:
-        booking (Booking): The booking instance containing user and listing details.
+        booking_id (UUID): The primary key of the confirmed booking.
+    """
+    booking = Booking.bookings.with_host().get(pk=booking_id)
+    subject, message = _booking_confirmation_message(booking)
+
+    # Assuming send_email is a utility function to send emails
+    send_email(booking.listing.host.email, booking.booked_by.email, subject, message)
+
+
+@shared_task
+def send_booking_confirmation_emails_bulk(booking_ids):
+    """
+    Sends the confirmation emails for a batch of bookings
+    over a single mail connection.
+
+    Args:
+        booking_ids (list): The primary keys of the confirmed bookings.
+
+    Returns:
+        int: The number of emails sent.
+    """
+    messages = []
+    for booking in Booking.bookings.with_host().filter(pk__in=booking_ids):
+        subject, message = _booking_confirmation_message(booking)
+        messages.append(
+            (subject, message, booking.listing.host.email, [booking.booked_by.email])
+        )
+
+    return mail.send_mass_mail(messages, connection=mail.get_connection())
+
+
+def _booking_confirmation_message(booking):
+    """
+    Builds the subject and body of a booking confirmation email.
+
+    Args:
+        booking (Booking): The booking, loaded with its guest and listing.
+
+    Returns:
+        tuple: The email subject and message.
     """
     subject = "Booking Confirmation"
     message = (
@@ -24,9 +70,7 @@ def send_booking_confirmation_email(booking: Booking):
         f"Check-out Date: {booking.check_out_date}\n\n"
         f"Thank you for choosing us!\n\nBest regards,\nThe Travel App Team"
     )
-
-    # Assuming send_email is a utility function to send emails
-    send_email(booking.host.email, booking.booked_by.email, subject, message)
+    return subject, message
 
 
 def send_email(from_email, to_email, subject, message):
@@ -42,3 +86,98 @@ def send_email(from_email, to_email, subject, message):
     print(
         f"Sending email from {from_email} to {to_email} with subject '{subject}' and message:\n{message}"
     )
+
+
+@cache
+def _get_seeder():
+    """
+    Returns a seed command instance with its Faker pools built.
+    The instance is cached so each worker process builds the pools once.
+    """
+    # Imported lazily so workers only load Faker when seeding
+    from .management.commands.seed import Command, get_faker
+
+    seeder = Command()
+    seeder._build_fake_pools(get_faker())
+    return seeder
+
+
+def _load_seeded(seeded_ids):
+    """
+    Loads the users and listings created by the earlier seed tasks.
+
+    Args:
+        seeded_ids (list): A pair of user IDs and listing IDs.
+    """
+    user_ids, listing_ids = seeded_ids
+    users = list(User.objects.filter(pk__in=user_ids))
+    listings = list(Listing.listings.select_related("host").filter(pk__in=listing_ids))
+    return users, listings
+
+
+@shared_task
+@transaction.atomic
+def seed_users(count):
+    """
+    Creates sample users.
+
+    Args:
+        count (int): The number of users to create.
+
+    Returns:
+        list: The IDs of the created users.
+    """
+    users = _get_seeder()._create_users(count)
+    return [str(user.pk) for user in users]
+
+
+@shared_task
+@transaction.atomic
+def seed_listings(user_ids, count):
+    """
+    Creates sample listings hosted by the seeded users.
+
+    Args:
+        user_ids (list): The IDs returned by seed_users.
+        count (int): The number of listings to create.
+
+    Returns:
+        list: The user IDs and the IDs of the created listings.
+    """
+    users = list(User.objects.filter(pk__in=user_ids))
+    listings = _get_seeder()._create_listings(users, count)
+    return [user_ids, [str(listing.pk) for listing in listings]]
+
+
+@shared_task
+@transaction.atomic
+def seed_bookings(seeded_ids, count):
+    """
+    Creates sample bookings for the seeded listings.
+
+    Args:
+        seeded_ids (list): The user and listing IDs returned by seed_listings.
+        count (int): The number of bookings to create.
+
+    Returns:
+        int: The number of bookings created.
+    """
+    users, listings = _load_seeded(seeded_ids)
+    return len(_get_seeder()._create_bookings(users, listings, count))
+
+
+@shared_task
+@transaction.atomic
+def seed_reviews(seeded_ids, count):
+    """
+    Creates sample reviews for the seeded listings.
+
+    Args:
+        seeded_ids (list): The user and listing IDs returned by seed_listings.
+        count (int): The number of reviews to create.
+
+    Returns:
+        int: The number of reviews created.
+    """
+    users, listings = _load_seeded(seeded_ids)
+    return len(_get_seeder()._create_reviews(users, listings, count))
@@ -6,12 +6,16 @@ Creates:
 - 12 Listings
 - 30 Bookings
 - 51 Reviews
+
+The generated accounts are disposable sample data: every regular user
+shares the password "Password123!" and the same stored hash.
 """
 
 import os
 import random
 import sys
 from datetime import timedelta
+from decimal import Decimal
 
 import django
 import faker
@@ -21,8 +25,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "alx_travel_app.settings")
 django.setup()
 
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from django.utils import timezone
 from listings.models import Booking, Listing, Review, User
+from listings.signals import update_average_rating
 
 # Initialize faker
 fake = faker.Faker()
@@ -32,6 +39,7 @@ NUM_USERS = 19
 NUM_LISTINGS = 12
 NUM_BOOKINGS = 30
 NUM_REVIEWS = 51
+BATCH_SIZE = 500
 
 # Listing types
 LISTING_TYPES = [
@@ -78,35 +86,40 @@ def create_users(count):
     email = "admin@example.com"
 
     # Create one admin user
-    admin_user = User.objects.create_user(
+    admin_user = User(
         email=email,
         username=email,
-        password="AdminPass123!",
         first_name="Admin",
         last_name="User",
         is_staff=True,
         is_superuser=True,
     )
+    admin_user.set_password("AdminPass123!")
     users.append(admin_user)
     print(f"Created admin user: {admin_user.email}")
 
+    # The accounts are throwaway samples, so hash the shared password once
+    # and give every regular user the same hash instead of one per user
+    password = make_password("Password123!")
+
     # Create regular users
     for i in range(1, count):
         first_name = fake.first_name()
         last_name = fake.last_name()
         email = f"{first_name.lower()}.{last_name.lower()}{i}@example.com"
 
-        user = User.objects.create_user(
+        user = User(
             email=email,
             username=email,
-            password="Password123!",
             first_name=first_name,
             last_name=last_name,
             date_of_birth=fake.date_of_birth(minimum_age=18, maximum_age=80),
         )
+        user.password = password
         users.append(user)
         print(f"Created user: {user.email}")
 
+    User.objects.bulk_create(users, batch_size=BATCH_SIZE)
     return users
 
 
@@ -114,50 +127,67 @@ def create_listings(count, users):
     """Create and save a specified number of listings."""
     print(f"\nCreating {count} listings...")
     listings = []
-
-    for i in range(count):
-        # Get a random host from users
-        host = random.choice(users)
-
-        # Generate a random date in the future
-        available_from = timezone.now() + timedelta(days=random.randint(1, 30))
-
-        # Generate random amenities (3-10)
-        amenities = random.sample(AMENITIES, random.randint(3, min(10, len(AMENITIES))))
-
+    now = timezone.now()
+
+    # Draw every random column in one call instead of one value per row
+    hosts = random.choices(users, k=count)
+    available_days = random.choices(range(1, 31), k=count)
+    amenity_counts = random.choices(range(3, min(10, len(AMENITIES)) + 1), k=count)
+    listing_types = random.choices(LISTING_TYPES, k=count)
+    prices = random.choices(range(5000, 50001), k=count)
+    guests = random.choices(range(1, 11), k=count)
+    bedrooms = random.choices(range(1, 6), k=count)
+    bathrooms = random.choices(range(1, 5), k=count)
+
+    for host, days, amenity_count, listing_type, price, guest, bedroom, bathroom in zip(
+        hosts,
+        available_days,
+        amenity_counts,
+        listing_types,
+        prices,
+        guests,
+        bedrooms,
+        bathrooms,
+    ):
         # Create listing
-        listing = Listing.objects.create(
+        listing = Listing(
             title=fake.sentence(nb_words=4)[:-1],  # Remove period at end
             description=fake.paragraph(nb_sentences=5),
-            listing_type=random.choice(LISTING_TYPES),
-            price_per_night=round(random.uniform(50, 500), 2),
+            listing_type=listing_type,
+            price_per_night=Decimal(price) / 100,
             location_address=fake.address(),
-            allowable_guests=random.randint(1, 10),
-            number_of_bedrooms=random.randint(1, 5),
-            number_of_bathrooms=random.randint(1, 4),
-            amenities=amenities,
+            allowable_guests=guest,
+            number_of_bedrooms=bedroom,
+            number_of_bathrooms=bathroom,
+            amenities=random.sample(AMENITIES, amenity_count),
             host=host,
-            available_from=available_from,
+            available_from=now + timedelta(days=days),
         )
         listings.append(listing)
         print(f"Created listing: {listing.title}")
 
+    Listing.listings.bulk_create(listings, batch_size=BATCH_SIZE)
     return listings
 
 
+def eligible_guests(users, listings):
+    """Map each listing to the users who are not its host."""
+    return {
+        listing.pk: [user for user in users if user.pk != listing.host_id]
+        for listing in listings
+    }
+
+
 def create_bookings(count, users, listings):
     """Create and save a specified number of bookings."""
     print(f"\nCreating {count} bookings...")
     bookings = []
+    eligible = eligible_guests(users, listings)
 
     for i in range(count):
-        # Get a random guest and listing
-        guest = random.choice(users)
+        # Get a random listing and a guest who is not its host
         listing = random.choice(listings)
-
-        # Make sure guest is not the host
-        while guest == listing.host:
-            guest = random.choice(users)
+        guest = random.choice(eligible[listing.pk])
 
         # Generate random dates
         start_date = listing.available_from + timedelta(days=random.randint(1, 60))
@@ -168,13 +198,13 @@ def create_bookings(count, users, listings):
         total_price = listing.price_per_night * duration
 
         # Create booking
-        booking = Booking.objects.create(
-            guest=guest,
+        booking = Booking(
+            booked_by=guest,
             listing=listing,
             check_in_date=start_date,
             check_out_date=end_date,
-            total_guests=random.randint(1, listing.allowable_guests),
-            total_price=total_price,
+            number_of_guests=random.randint(1, listing.allowable_guests),
+            amount_due=total_price,
             booking_status="CONFIRMED" if random.random() > 0.2 else "PENDING",
         )
         bookings.append(booking)
@@ -182,6 +212,7 @@ def create_bookings(count, users, listings):
             f"Created booking: {booking.booking_id} - {guest.email} booked {listing.title}"
         )
 
+    Booking.bookings.bulk_create(bookings, batch_size=BATCH_SIZE)
     return bookings
 
 
@@ -189,15 +220,12 @@ def create_reviews(count, users, listings):
     """Create and save a specified number of reviews."""
     print(f"\nCreating {count} reviews...")
     reviews = []
+    eligible = eligible_guests(users, listings)
 
     for i in range(count):
-        # Get a random reviewer and listing
-        reviewer = random.choice(users)
+        # Get a random listing and a reviewer who is not its host
         listing = random.choice(listings)
-
-        # Make sure reviewer is not the host
-        while reviewer == listing.host:
-            reviewer = random.choice(users)
+        reviewer = random.choice(eligible[listing.pk])
 
         # Generate a rating between 1 and 5
         rating = random.randint(1, 5)
@@ -211,8 +239,8 @@ def create_reviews(count, users, listings):
             comment = "Disappointing. " + fake.sentence()
 
         # Create review
-        review = Review.objects.create(
-            reviewer=reviewer,
+        review = Review(
+            reviewed_by=reviewer,
             listing=listing,
             rating=rating,
             comment=comment,
@@ -220,6 +248,12 @@ def create_reviews(count, users, listings):
         reviews.append(review)
         print(f"Created review: {reviewer.email} rated {listing.title} {rating}/5")
 
+    Review.reviews.bulk_create(reviews, batch_size=BATCH_SIZE)
+
+    # bulk_create skips the Review signals, so refresh the ratings once here
+    update_average_rating(
+        Listing.listings.filter(pk__in=[listing.pk for listing in listings])
+    )
     return reviews
 
 
@@ -237,17 +271,18 @@ def main():
             return
 
     try:
-        # Create users
-        users = create_users(NUM_USERS)
+        with transaction.atomic():
+            # Create users
+            users = create_users(NUM_USERS)
 
-        # Create listings
-        listings = create_listings(NUM_LISTINGS, users)
+            # Create listings
+            listings = create_listings(NUM_LISTINGS, users)
 
-        # Create bookings
-        bookings = create_bookings(NUM_BOOKINGS, users, listings)
+            # Create bookings
+            bookings = create_bookings(NUM_BOOKINGS, users, listings)
 
-        # Create reviews
-        reviews = create_reviews(NUM_REVIEWS, users, listings)
+            # Create reviews
+            reviews = create_reviews(NUM_REVIEWS, users, listings)
 
         # Summary
         print("\nDatabase population completed successfully!")
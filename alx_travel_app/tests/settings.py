@@ -0,0 +1,26 @@
+"""
+Settings for the test suite.
+Runs against an in-memory SQLite database whose tables are built
+straight from the models instead of replaying every migration.
+"""
+
+import os
+
+# The tests don't need a real secret, so don't require one in the environment
+os.environ.setdefault("SECRET_KEY", "insecure-test-secret-key")
+
+from alx_travel_app.settings import *  # noqa: E402,F401,F403
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {
+            "NAME": ":memory:",
+            "MIGRATE": False,
+        },
+    }
+}
+
+# Password hashing is not under test, so use the cheap MD5 hasher
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -7,42 +7,58 @@ import sys
 from datetime import timedelta
 
 import django
-
-
-from django.urls import reverse
-from django.utils import timezone
-
-# from listings.models import Booking, Listing, Review, User
-from rest_framework import status
-from rest_framework.test import APIClient, APITestCase
-
-
-# Setup Django environment
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "alx_travel_app.settings")
-django.setup()
-
+from django.apps import apps
+
+# Setup Django environment when the module is run directly;
+# manage.py test has already populated the app registry by now
+if not apps.ready:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    django.setup()
+
+from django.core.cache import cache  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from django.utils import timezone  # noqa: E402
+from rest_framework import status  # noqa: E402
+from rest_framework.test import (  # noqa: E402
+    APIRequestFactory,
+    APITestCase,
+    force_authenticate,
+)
 
 from listings.models import Booking, Listing, Review, User  # noqa: E402
-# Ensure the Django environment is set up correctly
+from listings.serializers import BookingSerializer, ListingSerializer  # noqa: E402
+from listings.views import (  # noqa: E402
+    BookingViewSet,
+    ListingViewSet,
+    ReviewViewSet,
+    UserViewSet,
+)
 
 
 class ViewsetTestCase(APITestCase):
     """Base test case for all viewset tests."""
 
-    def setUp(self):
-        """Set up test data."""
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for every test in the class."""
+        # A single frozen "now" keeps every date in the fixtures consistent
+        cls.NOW = timezone.now()
+
         # Create a test user
-        self.user_data = {
+        cls.user_data = {
             "email": "test@example.com",
+            "username": "test@example.com",
             "password": "password123",
             "first_name": "Test",
             "last_name": "User",
         }
-        self.user = User.objects.create_user(**self.user_data)
+        cls.user = User.objects.create_user(**cls.user_data)
 
         # Create a test listing
-        self.listing_data = {
+        cls.listing_data = {
             "title": "Test Listing",
             "description": "A test listing",
             "listing_type": "APARTMENT",
@@ -52,173 +68,352 @@ class ViewsetTestCase(APITestCase):
             "number_of_bedrooms": 2,
             "number_of_bathrooms": 1,
             "amenities": ["wifi", "parking"],
-            "host": self.user,
-            "available_from": timezone.now(),
+            "host": cls.user,
+            "available_from": cls.NOW,
         }
-        self.listing = Listing.objects.create(**self.listing_data)
+        cls.listing = Listing.listings.create(**cls.listing_data)
 
         # Create a test booking
-        self.booking_data = {
-            "guest": self.user,
-            "listing": self.listing,
-            "check_in_date": timezone.now() + timedelta(days=10),
-            "check_out_date": timezone.now() + timedelta(days=15),
-            "total_guests": 2,
+        cls.booking_data = {
+            "booked_by": cls.user,
+            "listing": cls.listing,
+            "check_in_date": cls.NOW + timedelta(days=10),
+            "check_out_date": cls.NOW + timedelta(days=15),
+            "number_of_guests": 2,
+            "amount_due": 500.00,
         }
-        self.booking = Booking.objects.create(**self.booking_data)
+        cls.booking = Booking.bookings.create(**cls.booking_data)
 
         # Create a test review
-        self.review_data = {
-            "reviewer": self.user,
-            "listing": self.listing,
+        cls.review_data = {
+            "reviewed_by": cls.user,
+            "listing": cls.listing,
             "rating": 4,
             "comment": "Great place!",
         }
-        self.review = Review.objects.create(**self.review_data)
+        cls.review = Review.reviews.create(**cls.review_data)
+
+        # Resolve the endpoint URLs once for every test in the class
+        cls.user_list_url = reverse("user-list")
+        cls.listing_list_url = reverse("listing-list")
+        cls.booking_list_url = reverse("booking-list")
+        cls.review_list_url = reverse("review-list")
+        cls.user_detail_url = reverse("user-detail", args=[cls.user.user_id])
+        cls.listing_detail_url = reverse(
+            "listing-detail", args=[cls.listing.listing_id]
+        )
+        cls.booking_detail_url = reverse(
+            "booking-detail", args=[cls.booking.booking_id]
+        )
+        cls.review_detail_url = reverse("review-detail", args=[cls.review.review_id])
+        cls.factory = APIRequestFactory()
+
+        # Build the create request bodies once for every test in the class
+        cls.new_user_payload = {
+            "email": "newuser@example.com",
+            "password": "newpassword123",
+            "first_name": "New",
+            "last_name": "User",
+        }
+        cls.new_listing_payload = {
+            "title": "New Listing",
+            "description": "A new test listing",
+            "listing_type": "HOUSE",
+            "price_per_night": 150.00,
+            "location_address": "456 Test Ave",
+            "allowable_guests": 6,
+            "number_of_bedrooms": 3,
+            "number_of_bathrooms": 2,
+            "amenities": ["wifi", "pool"],
+            "host": str(cls.user.user_id),
+            "available_from": cls.NOW.isoformat(),
+        }
+        cls.new_booking_payload = {
+            "booked_by": str(cls.user.user_id),
+            "listing": str(cls.listing.listing_id),
+            "check_in_date": (cls.NOW + timedelta(days=20)).isoformat(),
+            "check_out_date": (cls.NOW + timedelta(days=25)).isoformat(),
+            "number_of_guests": 3,
+        }
+        cls.new_review_payload = {
+            "reviewed_by": str(cls.user.user_id),
+            "listing": str(cls.listing.listing_id),
+            "rating": 5,
+            "comment": "Excellent stay!",
+        }
 
-        # Setup API client with authentication
-        self.client = APIClient()
+    def setUp(self):
+        """Authenticate the API client for each test."""
+        # APITestCase already builds a fresh APIClient per test, so reuse it
         self.client.force_authenticate(user=self.user)
+        # Cached list pages must not leak between tests
+        cache.clear()
+
+    def get_view(self, viewset, url, **kwargs):
+        """
+        Call a viewset's list action, or retrieve when a pk is given,
+        directly instead of going through the middleware and URL resolver.
+        """
+        request = self.factory.get(url)
+        force_authenticate(request, user=self.user)
+        action = "retrieve" if kwargs else "list"
+        return viewset.as_view({"get": action})(request, **kwargs)
+
+
+class ListEndpointsTest(ViewsetTestCase):
+    """Tests for the list and retrieve actions of every viewset."""
+
+    def test_list(self):
+        """Test that each viewset lists its instances."""
+        cases = [
+            (UserViewSet, self.user_list_url),
+            (ListingViewSet, self.listing_list_url),
+            (BookingViewSet, self.booking_list_url),
+            (ReviewViewSet, self.review_list_url),
+        ]
+        for viewset, url in cases:
+            with self.subTest(viewset=viewset.__name__):
+                response = self.get_view(viewset, url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertTrue(response.data["results"])
+
+    def test_retrieve(self):
+        """Test that each viewset retrieves a single instance."""
+        cases = [
+            (UserViewSet, self.user_detail_url, self.user, "email"),
+            (ListingViewSet, self.listing_detail_url, self.listing, "title"),
+            (
+                BookingViewSet,
+                self.booking_detail_url,
+                self.booking,
+                "number_of_guests",
+            ),
+            (ReviewViewSet, self.review_detail_url, self.review, "rating"),
+        ]
+        for viewset, url, instance, field in cases:
+            with self.subTest(viewset=viewset.__name__):
+                response = self.get_view(viewset, url, pk=instance.pk)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data[field], getattr(instance, field))
 
 
 class UserViewsetTest(ViewsetTestCase):
     """Tests for the UserViewSet."""
 
-    def test_list_users(self):
-        """Test that users can be listed."""
-        url = reverse("user-list")
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreater(len(response.data), 0)
-
     def test_create_user(self):
         """Test that a user can be created."""
-        url = reverse("user-list")
-        data = {
-            "email": "newuser@example.com",
-            "password": "newpassword123",
-            "first_name": "New",
-            "last_name": "User",
-        }
-        response = self.client.post(url, data, format="json")
+        url = self.user_list_url
+        response = self.client.post(url, self.new_user_payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(
-            User.objects.filter(email="newuser@example.com").exists(), True
-        )
-
-    def test_retrieve_user(self):
-        """Test that a user can be retrieved."""
-        url = reverse("user-detail", args=[self.user.user_id])
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["email"], self.user.email)
+        self.assertEqual(response.data["email"], "newuser@example.com")
+
+    def test_create_user_hashes_hash_like_password(self):
+        """Test that a password shaped like a stored hash is still hashed."""
+        url = self.user_list_url
+        password = "pbkdf2_sha256$hello-world-123"
+        payload = {**self.new_user_payload, "password": password}
+        response = self.client.post(url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = User.objects.get(email=payload["email"])
+        self.assertNotEqual(user.password, password)
+        self.assertTrue(user.check_password(password))
 
 
 class ListingViewsetTest(ViewsetTestCase):
     """Tests for the ListingViewSet."""
 
-    def test_list_listings(self):
-        """Test that listings can be listed."""
-        url = reverse("listing-list")
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreater(len(response.data), 0)
-
     def test_create_listing(self):
         """Test that a listing can be created."""
-        url = reverse("listing-list")
-        data = {
-            "title": "New Listing",
-            "description": "A new test listing",
-            "listing_type": "HOUSE",
-            "price_per_night": 150.00,
-            "location_address": "456 Test Ave",
-            "allowable_guests": 6,
-            "number_of_bedrooms": 3,
-            "number_of_bathrooms": 2,
-            "amenities": ["wifi", "pool"],
-            "host": str(self.user.user_id),
-            "available_from": timezone.now().isoformat(),
-        }
-        response = self.client.post(url, data, format="json")
+        url = self.listing_list_url
+        response = self.client.post(url, self.new_listing_payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Listing.objects.filter(title="New Listing").exists(), True)
+        self.assertEqual(response.data["title"], "New Listing")
+
+    def test_create_listings_in_bulk(self):
+        """Test that a list of listings is created in one request."""
+        url = self.listing_list_url
+        payload = [
+            {**self.new_listing_payload, "title": f"Bulk Listing {i}"} for i in range(3)
+        ]
+        response = self.client.post(url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [listing["title"] for listing in response.data],
+            [listing["title"] for listing in payload],
+        )
+        self.assertEqual(
+            Listing.listings.filter(title__startswith="Bulk Listing").count(), 3
+        )
+
+    def test_update_listing_with_array_body(self):
+        """Test that an array body is rejected on update, not bulk handled."""
+        url = self.listing_detail_url
+        response = self.client.put(url, [self.new_listing_payload], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_listings_query_count(self):
+        """Test that listing serialization does not query per listing."""
+        Listing.listings.bulk_create(
+            [
+                Listing(**{**self.listing_data, "title": f"Extra Listing {i}"})
+                for i in range(3)
+            ]
+        )
+        url = self.listing_list_url
+        # One query for the ETag aggregate and one for the page of listings
+        with self.assertNumQueries(2):
+            response = self.get_view(ListingViewSet, url)
+            data = response.data
+        self.assertEqual(len(data["results"]), 4)
+
+    def test_list_listings_paginates_timestamp_ties(self):
+        """Test that listings sharing a created_at are each paged exactly once."""
+        Listing.listings.bulk_create(
+            [
+                Listing(**{**self.listing_data, "title": f"Tied Listing {i}"})
+                for i in range(30)
+            ]
+        )
+        Listing.listings.update(created_at=self.NOW)
+
+        seen = []
+        url = self.listing_list_url
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen += [listing["listing_id"] for listing in response.data["results"]]
+            url = response.data["next"]
+        self.assertEqual(len(seen), 31)
+        self.assertCountEqual(
+            seen, [str(pk) for pk in Listing.listings.values_list("pk", flat=True)]
+        )
+
+    def test_list_listings_cached(self):
+        """Test that an unchanged listing page is served from the cache."""
+        url = self.listing_list_url
+        first = self.get_view(ListingViewSet, url).data
+        # Only the ETag aggregate runs once the page is cached
+        with self.assertNumQueries(1):
+            response = self.get_view(ListingViewSet, url)
+        self.assertEqual(response.data, first)
+
+        Listing.listings.create(**{**self.listing_data, "title": "Fresh Listing"})
+        response = self.get_view(ListingViewSet, url)
+        self.assertEqual(response.data["results"][0]["title"], "Fresh Listing")
+
+    def test_list_listings_cache_headers(self):
+        """Test that an unchanged listing list revalidates with 304."""
+        response = self.client.get(self.listing_list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("max-age=60", response["Cache-Control"])
 
-    def test_retrieve_listing(self):
-        """Test that a listing can be retrieved."""
-        url = reverse("listing-detail", args=[self.listing.listing_id])
-        response = self.client.get(url)
+        response = self.client.get(
+            self.listing_list_url, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_listings_gzip(self):
+        """Test that the listing list is compressed when the client accepts it."""
+        response = self.client.get(
+            self.listing_list_url, HTTP_ACCEPT_ENCODING="gzip, deflate"
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["title"], self.listing.title)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_listing_serialization(self):
+        """Test that a loaded listing serializes without further queries."""
+        listing = Listing.listings.get(pk=self.listing.pk)
+        with CaptureQueriesContext(connection) as queries:
+            data = ListingSerializer(listing).data
+        self.assertEqual(len(queries), 0)
+
+        expected = {
+            "listing_id": str(self.listing.listing_id),
+            "title": self.listing_data["title"],
+            "listing_type": self.listing_data["listing_type"],
+            "host": self.user.user_id,
+            "amenities": self.listing_data["amenities"],
+            "average_rating": float(self.review.rating),
+        }
+        self.assertEqual({field: data[field] for field in expected}, expected)
 
 
 class BookingViewsetTest(ViewsetTestCase):
     """Tests for the BookingViewSet."""
 
-    def test_list_bookings(self):
-        """Test that bookings can be listed."""
-        url = reverse("booking-list")
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreater(len(response.data), 0)
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the invalid booking payloads once for the class."""
+        super().setUpTestData()
+        cls.invalid_dates_payload = {
+            **cls.new_booking_payload,
+            "check_in_date": (cls.NOW + timedelta(days=25)).isoformat(),
+            "check_out_date": (cls.NOW + timedelta(days=20)).isoformat(),
+        }
+        cls.short_stay_payload = {
+            **cls.new_booking_payload,
+            "check_out_date": (cls.NOW + timedelta(days=20, hours=12)).isoformat(),
+        }
+        cls.invalid_guests_payload = {
+            **cls.new_booking_payload,
+            "number_of_guests": cls.listing.allowable_guests + 1,
+        }
 
     def test_create_booking(self):
         """Test that a booking can be created."""
-        url = reverse("booking-list")
-        data = {
-            "guest": str(self.user.user_id),
-            "listing": str(self.listing.listing_id),
-            "check_in_date": (timezone.now() + timedelta(days=20)).isoformat(),
-            "check_out_date": (timezone.now() + timedelta(days=25)).isoformat(),
-            "total_guests": 3,
-        }
-        response = self.client.post(url, data, format="json")
+        url = self.booking_list_url
+        response = self.client.post(url, self.new_booking_payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Booking.objects.filter(total_guests=3).exists(), True)
+        self.assertEqual(response.data["number_of_guests"], 3)
+
+    def test_validate_dates(self):
+        """Test that a check-out date before check-in is rejected."""
+        serializer = BookingSerializer(data=self.invalid_dates_payload)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn(
+            "Check-out date must be after check-in date.",
+            serializer.errors["non_field_errors"],
+        )
 
-    def test_retrieve_booking(self):
-        """Test that a booking can be retrieved."""
-        url = reverse("booking-detail", args=[self.booking.booking_id])
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["total_guests"], self.booking.total_guests)
+    def test_validate_short_stay(self):
+        """Test that a stay shorter than one night is rejected."""
+        serializer = BookingSerializer(data=self.short_stay_payload)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn(
+            "A booking must cover at least one night.",
+            serializer.errors["non_field_errors"],
+        )
+
+    def test_validate_guests(self):
+        """Test that more guests than the listing allows is rejected."""
+        serializer = BookingSerializer(data=self.invalid_guests_payload)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn(
+            "Number of guests cannot exceed",
+            str(serializer.errors["non_field_errors"][0]),
+        )
 
 
 class ReviewViewsetTest(ViewsetTestCase):
     """Tests for the ReviewViewSet."""
 
-    def test_list_reviews(self):
-        """Test that reviews can be listed."""
-        url = reverse("review-list")
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreater(len(response.data), 0)
-
     def test_create_review(self):
         """Test that a review can be created."""
-        url = reverse("review-list")
-        data = {
-            "reviewer": str(self.user.user_id),
-            "listing": str(self.listing.listing_id),
-            "rating": 5,
-            "comment": "Excellent stay!",
-        }
-        response = self.client.post(url, data, format="json")
+        url = self.review_list_url
+        response = self.client.post(url, self.new_review_payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Review.objects.filter(rating=5).exists(), True)
-
-    def test_retrieve_review(self):
-        """Test that a review can be retrieved."""
-        url = reverse("review-detail", args=[self.review.review_id])
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["rating"], self.review.rating)
+        self.assertEqual(response.data["rating"], 5)
 
 
 # This allows the tests to be run directly with python tests/test_viewsets.py
 if __name__ == "__main__":
-    from django.test.runner import DiscoverRunner
-
-    test_runner = DiscoverRunner(verbosity=1)
+    from django.test.runner import DiscoverRunner, get_max_test_processes
+
+    # Shard the test classes across worker processes, leaving two cores free.
+    # keepdb reuses the test database between runs on file-backed databases;
+    # drop it once after model changes to rebuild the schema.
+    test_runner = DiscoverRunner(
+        verbosity=1, keepdb=True, parallel=max(1, get_max_test_processes() - 2)
+    )
     failures = test_runner.run_tests(["tests.test_viewsets"])
     sys.exit(bool(failures))